@@ -0,0 +1,68 @@
+"""
+Latency benchmark for the /explain tree-path explainer.
+
+Compares a plain prediction with a full per-field explanation for a single
+request, and reports the one-off cost of precomputing the path tables.
+
+    python benchmarks/explain_latency.py
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from car_prediction.explain import TreePathExplainer
+from car_prediction.main import (
+    FIELD_COLUMNS,
+    CarFeatures,
+    build_input_frame,
+    features_to_columns,
+    model,
+    model_info,
+)
+
+
+def time_calls(fn, repeats):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return np.array(timings) * 1000
+
+
+def report(label, timings_ms):
+    print(
+        f"{label:<28} p50 {np.percentile(timings_ms, 50):8.3f} ms   "
+        f"p99 {np.percentile(timings_ms, 99):8.3f} ms"
+    )
+
+
+def main(repeats=500, batch_size=1000):
+    start = time.perf_counter()
+    explainer = TreePathExplainer(model, model_info["feature_names"], FIELD_COLUMNS)
+    print(f"Path table precompute: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    single = build_input_frame(features_to_columns([CarFeatures()]))
+    batch = pd.concat([single] * batch_size, ignore_index=True)
+
+    # Sanity check: contributions must add back up to the model's prediction
+    predictions, _ = explainer.explain(batch)
+    max_error = np.abs(predictions - model.predict(batch)).max()
+    print(f"Max |explained - predicted|: {max_error:.6f} USD\n")
+
+    report("predict (1 row)", time_calls(lambda: model.predict(single), repeats))
+    report("explain (1 row)", time_calls(lambda: explainer.explain(single), repeats))
+    report(
+        f"predict ({batch_size} rows)",
+        time_calls(lambda: model.predict(batch), repeats // 10),
+    )
+    report(
+        f"explain ({batch_size} rows)",
+        time_calls(lambda: explainer.explain(batch), repeats // 10),
+    )
+
+
+if __name__ == "__main__":
+    main()
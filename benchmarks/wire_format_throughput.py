@@ -0,0 +1,125 @@
+"""
+Throughput benchmark for /predict/batch: JSON vs Arrow IPC.
+
+For each batch size it reports the server-side decode cost (body bytes to
+the pipeline's input DataFrame) and the end-to-end request time through the
+ASGI app, including client-side encoding of the body.
+
+    pip install -e ".[arrow]"
+    python benchmarks/wire_format_throughput.py
+"""
+
+import json
+import time
+
+import numpy as np
+import pyarrow as pa
+from fastapi.testclient import TestClient
+
+from car_prediction.main import (
+    FIELD_TYPES,
+    app,
+    build_input_frame,
+    car_features_list,
+    features_to_columns,
+)
+from car_prediction.wire_format import ARROW_STREAM, decode_columns
+
+MAKES = ["Porsche", "Ferrari", "Lamborghini", "McLaren", "Audi", "BMW"]
+
+
+def make_columns(n_rows, seed=0):
+    rng = np.random.default_rng(seed)
+    return {
+        "car_make": rng.choice(MAKES, n_rows).tolist(),
+        "car_model": rng.choice(["911", "488 GTB", "Huracan", "720S"], n_rows).tolist(),
+        "year": rng.integers(2015, 2024, n_rows).tolist(),
+        "engine_size": rng.choice([0.0, 3.0, 3.9, 5.2], n_rows).tolist(),
+        "horsepower": rng.integers(300, 1000, n_rows).tolist(),
+        "torque": rng.integers(250, 900, n_rows).tolist(),
+        "zero_to_sixty_time": np.round(rng.uniform(2.5, 5.0, n_rows), 1).tolist(),
+    }
+
+
+def json_body(columns):
+    rows = [dict(zip(columns, values)) for values in zip(*columns.values())]
+    return json.dumps(rows).encode()
+
+
+def arrow_body(columns):
+    table = pa.table(
+        {
+            field: pa.array(values, pa.string() if kind is str else pa.float64())
+            for (field, values), kind in zip(columns.items(), FIELD_TYPES.values())
+        }
+    )
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def best_of(fn, repeats):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(sizes=(1_000, 100_000)):
+    client = TestClient(app)
+
+    for n_rows in sizes:
+        repeats = 5 if n_rows <= 10_000 else 2
+        columns = make_columns(n_rows)
+        json_payload = json_body(columns)
+        arrow_payload = arrow_body(columns)
+        print(
+            f"\n{n_rows:,} rows  (JSON {len(json_payload) / 1e6:.2f} MB, "
+            f"Arrow {len(arrow_payload) / 1e6:.2f} MB)"
+        )
+
+        decode_json = best_of(
+            lambda: build_input_frame(
+                features_to_columns(car_features_list.validate_json(json_payload))
+            ),
+            repeats,
+        )
+        decode_arrow = best_of(
+            lambda: build_input_frame(decode_columns(arrow_payload, FIELD_TYPES)),
+            repeats,
+        )
+
+        request_json = best_of(
+            lambda: client.post(
+                "/predict/batch",
+                content=json_body(columns),
+                headers={"content-type": "application/json"},
+            ),
+            repeats,
+        )
+        request_arrow = best_of(
+            lambda: client.post(
+                "/predict/batch",
+                content=arrow_body(columns),
+                headers={"content-type": ARROW_STREAM},
+            ),
+            repeats,
+        )
+
+        for label, seconds in [
+            ("decode JSON", decode_json),
+            ("decode Arrow", decode_arrow),
+            ("request JSON", request_json),
+            ("request Arrow", request_arrow),
+        ]:
+            print(
+                f"  {label:<14} {seconds * 1000:9.1f} ms  "
+                f"{n_rows / seconds:12,.0f} rows/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+"""
+Streaming drift monitor for live prediction inputs.
+
+Training saves a reference distribution per input column in
+``car_price_model_info.joblib``: decile histograms for numeric columns and
+category frequencies for categorical ones. At serving time the monitor keeps
+fixed-size counters over the same bins and categories, plus counters for
+numeric values outside the training range and for categories the encoder
+has never seen (which ``handle_unknown="ignore"`` silently zeroes out).
+
+Memory is constant and each update costs a bin lookup per value. Drift is
+scored with the population stability index (PSI) between the reference and
+live distributions.
+"""
+
+import threading
+from bisect import bisect_right
+
+import numpy as np
+import pandas as pd
+
+# Conventional PSI bands: below 0.1 is stable, above 0.25 is significant
+PSI_MODERATE = 0.1
+PSI_SIGNIFICANT = 0.25
+
+# Additive (Laplace) smoothing pseudo-count per bin, so empty bins stay finite
+PSI_SMOOTHING = 1.0
+
+# Training range percentiles; the raw min/max are dominated by a few outliers
+RANGE_PERCENTILES = (0.5, 99.5)
+
+# Updates this small take a pure-Python path; pandas/NumPy setup costs more
+# than the lookups themselves for a single /predict row.
+SMALL_UPDATE_ROWS = 16
+
+
+def build_reference_distributions(X, numeric_features, categorical_features, n_bins=10):
+    """
+    Summarize training inputs into the reference used by ``DriftMonitor``.
+    """
+    numeric = {}
+    for column in numeric_features:
+        values = np.asarray(X[column], dtype=float)
+        edges = np.unique(np.quantile(values, np.linspace(0, 1, n_bins + 1)[1:-1]))
+        counts = np.bincount(
+            np.searchsorted(edges, values, side="right"), minlength=len(edges) + 1
+        )
+        low, high = np.percentile(values, RANGE_PERCENTILES)
+        numeric[column] = {
+            "edges": edges.tolist(),
+            "proportions": (counts / counts.sum()).tolist(),
+            "low": float(low),
+            "high": float(high),
+        }
+
+    categorical = {}
+    for column in categorical_features:
+        frequencies = X[column].astype(str).value_counts(normalize=True)
+        categorical[column] = {
+            "categories": frequencies.index.tolist(),
+            "proportions": frequencies.tolist(),
+        }
+
+    return {"n_rows": len(X), "numeric": numeric, "categorical": categorical}
+
+
+def population_stability_index(expected_counts, actual_counts):
+    """
+    PSI between two histograms, with additive smoothing of both.
+    """
+    expected = np.asarray(expected_counts, dtype=float) + PSI_SMOOTHING
+    actual = np.asarray(actual_counts, dtype=float) + PSI_SMOOTHING
+    expected /= expected.sum()
+    actual /= actual.sum()
+    return float(np.sum((actual - expected) * np.log(actual / expected)))
+
+
+class DriftMonitor:
+    """
+    Constant-memory sketches of live inputs compared against the reference.
+
+    ``status`` stays ``insufficient_data`` until ``min_rows`` inputs have
+    been observed; below that, sampling noise alone pushes PSI over the
+    alert bands. Categorical columns are scored over their ``top_k`` most
+    frequent training categories, one "other" bucket for the remaining known
+    ones and one for unseen values, so high-cardinality columns like
+    ``Car Model`` are not dominated by empty bins.
+    """
+
+    def __init__(self, reference, labels=None, min_rows=500, top_k=10):
+        self.labels = labels or {}
+        self.min_rows = min_rows
+        self.top_k = top_k
+        self._reference_rows = reference["n_rows"]
+        self._lock = threading.Lock()
+        self._observed = 0
+
+        self._numeric = {}
+        for column, ref in reference["numeric"].items():
+            self._numeric[column] = {
+                "edges": np.asarray(ref["edges"], dtype=float),
+                "edge_list": list(ref["edges"]),
+                "proportions": np.asarray(ref["proportions"], dtype=float),
+                "low": ref["low"],
+                "high": ref["high"],
+                "counts": np.zeros(len(ref["proportions"]), dtype=np.int64),
+                "below_range": 0,
+                "above_range": 0,
+            }
+
+        self._categorical = {}
+        for column, ref in reference["categorical"].items():
+            categories = ref["categories"]
+            self._categorical[column] = {
+                "index": {category: i for i, category in enumerate(categories)},
+                # Unknown categories share the last slot, expected at 0%
+                "proportions": np.append(ref["proportions"], 0.0),
+                "counts": np.zeros(len(categories) + 1, dtype=np.int64),
+            }
+
+    def update(self, input_data):
+        """
+        Add raw model inputs to the live sketches.
+
+        ``input_data`` maps training column names to values: a DataFrame, or
+        a dict of lists, which is far cheaper to build for a single request.
+        """
+        n_rows = len(input_data[next(iter(self._numeric))])
+        if n_rows == 0:
+            return
+        if n_rows <= SMALL_UPDATE_ROWS:
+            self._update_rows(input_data, n_rows)
+        else:
+            self._update_batch(input_data, n_rows)
+
+    def _update_rows(self, input_data, n_rows):
+        increments = []
+        out_of_range = []
+        for column, sketch in self._numeric.items():
+            for value in list(input_data[column]):
+                value = float(value)
+                increments.append(
+                    (sketch["counts"], bisect_right(sketch["edge_list"], value))
+                )
+                if value < sketch["low"]:
+                    out_of_range.append((sketch, "below_range"))
+                elif value > sketch["high"]:
+                    out_of_range.append((sketch, "above_range"))
+
+        for column, sketch in self._categorical.items():
+            unknown = len(sketch["counts"]) - 1
+            for value in list(input_data[column]):
+                increments.append(
+                    (sketch["counts"], sketch["index"].get(str(value), unknown))
+                )
+
+        with self._lock:
+            self._observed += n_rows
+            for counts, slot in increments:
+                counts[slot] += 1
+            for sketch, key in out_of_range:
+                sketch[key] += 1
+
+    def _update_batch(self, input_data, n_rows):
+        numeric_updates = {}
+        for column, sketch in self._numeric.items():
+            values = np.asarray(input_data[column], dtype=float)
+            bins = np.searchsorted(sketch["edges"], values, side="right")
+            numeric_updates[column] = (
+                np.bincount(bins, minlength=len(sketch["counts"])),
+                int(np.count_nonzero(values < sketch["low"])),
+                int(np.count_nonzero(values > sketch["high"])),
+            )
+
+        categorical_updates = {}
+        for column, sketch in self._categorical.items():
+            unknown = len(sketch["counts"]) - 1
+            slots = (
+                pd.Series(input_data[column], dtype=object)
+                .astype(str)
+                .map(sketch["index"])
+                .fillna(unknown)
+                .to_numpy(dtype=np.intp)
+            )
+            categorical_updates[column] = np.bincount(
+                slots, minlength=len(sketch["counts"])
+            )
+
+        with self._lock:
+            self._observed += n_rows
+            for column, (counts, below, above) in numeric_updates.items():
+                sketch = self._numeric[column]
+                sketch["counts"] += counts
+                sketch["below_range"] += below
+                sketch["above_range"] += above
+            for column, counts in categorical_updates.items():
+                self._categorical[column]["counts"] += counts
+
+    def reset(self):
+        with self._lock:
+            self._observed = 0
+            for sketch in self._numeric.values():
+                sketch["counts"][:] = 0
+                sketch["below_range"] = 0
+                sketch["above_range"] = 0
+            for sketch in self._categorical.values():
+                sketch["counts"][:] = 0
+
+    def _top_k_buckets(self, values):
+        # Top-k known categories, the remaining known ones, then unknowns
+        return np.concatenate(
+            [values[: self.top_k], [values[self.top_k : -1].sum(), values[-1]]]
+        )
+
+    def scores(self):
+        """
+        Per-column drift scores and an overall status.
+        """
+        with self._lock:
+            observed = self._observed
+            numeric = {
+                column: (
+                    sketch["counts"].copy(),
+                    sketch["below_range"],
+                    sketch["above_range"],
+                )
+                for column, sketch in self._numeric.items()
+            }
+            categorical = {
+                column: sketch["counts"].copy()
+                for column, sketch in self._categorical.items()
+            }
+
+        if observed == 0:
+            return {
+                "observed_rows": 0,
+                "min_rows": self.min_rows,
+                "max_psi": 0.0,
+                "status": "no_data",
+                "features": {},
+            }
+
+        features = {}
+        for column, (counts, below, above) in numeric.items():
+            expected = self._numeric[column]["proportions"] * self._reference_rows
+            features[self.labels.get(column, column)] = {
+                "psi": population_stability_index(expected, counts),
+                "below_range_rate": below / observed,
+                "above_range_rate": above / observed,
+            }
+
+        for column, counts in categorical.items():
+            expected = self._categorical[column]["proportions"] * self._reference_rows
+            features[self.labels.get(column, column)] = {
+                "psi": population_stability_index(
+                    self._top_k_buckets(expected), self._top_k_buckets(counts)
+                ),
+                "unknown_rate": float(counts[-1] / observed),
+            }
+
+        max_psi = max(feature["psi"] for feature in features.values())
+        if observed < self.min_rows:
+            status = "insufficient_data"
+        elif max_psi >= PSI_SIGNIFICANT:
+            status = "significant"
+        elif max_psi >= PSI_MODERATE:
+            status = "moderate"
+        else:
+            status = "stable"
+
+        return {
+            "observed_rows": observed,
+            "min_rows": self.min_rows,
+            "max_psi": max_psi,
+            "status": status,
+            "features": features,
+        }
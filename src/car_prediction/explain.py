@@ -0,0 +1,123 @@
+"""
+Fast local explanations for the random forest price model.
+
+Uses the Saabas tree-path decomposition: along a sample's decision path,
+every split moves the estimate from the parent node's mean price to the
+child node's mean price, and that delta is credited to the feature the
+parent split on. Summed over the path and averaged over the forest, the
+credits plus the forest's base value add up exactly to the prediction.
+
+The per-node credits only depend on the fitted trees, so they are computed
+once at load time. Explaining a request is then a single ``apply`` to find
+the leaves followed by one vectorized gather over the precomputed table.
+"""
+
+import numpy as np
+
+from car_prediction.models.compression import TreeArrays
+
+
+def map_features_to_fields(feature_names, field_columns):
+    """
+    Map each encoded feature name to the index of the input field it came from.
+
+    ``feature_names`` are the names saved in ``car_price_model_info.joblib``:
+    numeric columns keep their name, one-hot columns are ``"<column>_<value>"``.
+    """
+    column_to_field = {column: i for i, column in enumerate(field_columns.values())}
+    field_index = np.empty(len(feature_names), dtype=np.intp)
+
+    for i, name in enumerate(feature_names):
+        if name in column_to_field:
+            field_index[i] = column_to_field[name]
+            continue
+        matches = [
+            column for column in column_to_field if name.startswith(column + "_")
+        ]
+        if not matches:
+            raise ValueError(f"Cannot map feature '{name}' to an input field")
+        # Prefer the longest prefix in case one column name prefixes another
+        field_index[i] = column_to_field[max(matches, key=len)]
+
+    return field_index
+
+
+def _forest_trees(forest):
+    """
+    Node arrays for every tree of a fitted forest or a ``LiteForestRegressor``.
+    """
+    if hasattr(forest, "tree_arrays"):
+        return list(forest.tree_arrays())
+    return [
+        TreeArrays(
+            children_left=tree.children_left,
+            children_right=tree.children_right,
+            feature=tree.feature,
+            value=tree.value[:, 0, 0],
+        )
+        for tree in (estimator.tree_ for estimator in forest.estimators_)
+    ]
+
+
+def _node_contributions(tree, field_index, n_fields):
+    """
+    Accumulated per-field contributions from the root down to every node.
+    """
+    children_left = tree.children_left
+    children_right = tree.children_right
+    value = tree.value
+
+    contributions = np.zeros((len(value), n_fields))
+    # Children are always numbered after their parent, so a single pass in
+    # node order visits every parent before its children.
+    for node in np.flatnonzero(children_left != -1):
+        field = field_index[tree.feature[node]]
+        for child in (children_left[node], children_right[node]):
+            contributions[child] = contributions[node]
+            contributions[child, field] += value[child] - value[node]
+
+    return contributions
+
+
+class TreePathExplainer:
+    """
+    Per-field price contributions for a fitted preprocessing + forest pipeline.
+
+    Works with both the full ``RandomForestRegressor`` and the lite model.
+    """
+
+    def __init__(self, pipeline, feature_names, field_columns):
+        self.preprocessor = pipeline.named_steps["preprocessor"]
+        self.forest = pipeline.named_steps["regressor"]
+        self.fields = list(field_columns)
+
+        field_index = map_features_to_fields(feature_names, field_columns)
+
+        tables = []
+        offsets = []
+        root_values = []
+        offset = 0
+        for tree in _forest_trees(self.forest):
+            tables.append(_node_contributions(tree, field_index, len(self.fields)))
+            offsets.append(offset)
+            root_values.append(tree.value[0])
+            offset += len(tree.value)
+
+        # One table for the whole forest; leaf ids are shifted by each tree's
+        # offset so a batch of paths is resolved with a single fancy index.
+        self._contributions = np.vstack(tables)
+        self._offsets = np.asarray(offsets, dtype=np.intp)
+        self.base_value = float(np.mean(root_values))
+
+    def explain(self, input_data):
+        """
+        Explain a DataFrame of raw model inputs.
+
+        Returns ``(predictions, contributions)`` where ``contributions`` has one
+        column per input field and each row sums to ``prediction - base_value``.
+        """
+        X = self.preprocessor.transform(input_data)
+        leaves = self.forest.apply(X) + self._offsets
+        contributions = self._contributions[leaves].mean(axis=1)
+        predictions = self.base_value + contributions.sum(axis=1)
+        return predictions, contributions
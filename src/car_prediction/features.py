@@ -0,0 +1,69 @@
+"""
+Mapping between API request fields and the columns the model was trained on.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Maps CarFeatures fields to the training columns they feed
+FIELD_COLUMNS = {
+    "car_make": "Car Make",
+    "car_model": "Car Model",
+    "year": "Year",
+    "engine_size": "Engine Size (L)",
+    "horsepower": "Horsepower",
+    "torque": "Torque (lb-ft)",
+    "zero_to_sixty_time": "0-60 MPH Time (seconds)",
+}
+
+
+def process_engine_size(engine_size):
+    engine_size = np.asarray(engine_size, dtype=float)
+    return np.where(engine_size == 0, "Electric", engine_size.astype(str))
+
+
+def engine_size_category(engine_size):
+    """
+    Scalar version of ``process_engine_size``.
+    """
+    return "Electric" if engine_size == 0 else str(float(engine_size))
+
+
+def features_to_columns(features_list):
+    return {
+        field: [getattr(features, field) for features in features_list]
+        for field in FIELD_COLUMNS
+    }
+
+
+def build_input_frame(columns) -> pd.DataFrame:
+    """
+    Build the training-schema DataFrame from per-field column arrays.
+    """
+    return pd.DataFrame(
+        {
+            "Car Make": np.asarray(columns["car_make"], dtype=object),
+            "Car Model": np.asarray(columns["car_model"], dtype=object),
+            "Year": np.asarray(columns["year"], dtype=float),
+            "Engine Size (L)": process_engine_size(columns["engine_size"]),
+            "Horsepower": np.asarray(columns["horsepower"], dtype=float),
+            "Torque (lb-ft)": np.asarray(columns["torque"], dtype=float),
+            "0-60 MPH Time (seconds)": np.asarray(
+                columns["zero_to_sixty_time"], dtype=float
+            ),
+        }
+    )
+
+
+def input_columns(columns):
+    """
+    Training-schema columns as plain lists, for cheap per-request bookkeeping.
+    """
+    return {
+        column: (
+            [engine_size_category(value) for value in columns[field]]
+            if field == "engine_size"
+            else list(columns[field])
+        )
+        for field, column in FIELD_COLUMNS.items()
+    }
@@ -1,16 +1,48 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from typing import List
+
+from fastapi import FastAPI, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
-from pydantic import BaseModel
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import HTMLResponse, JSONResponse, Response
+from pydantic import BaseModel, TypeAdapter, ValidationError
+import hashlib
 import joblib
-import pandas as pd
+import numpy as np
 import os
 import uvicorn
 
+from car_prediction.drift import DriftMonitor
+from car_prediction.explain import TreePathExplainer
+from car_prediction.features import (
+    FIELD_COLUMNS,
+    build_input_frame,
+    features_to_columns,
+    input_columns,
+)
+from car_prediction.prediction_log import PredictionLog
+from car_prediction.wire_format import (
+    ARROW_STREAM,
+    arrow_available,
+    decode_columns,
+    encode_predictions,
+)
+
+
+@asynccontextmanager
+async def lifespan(app):
+    yield
+    # Flush buffered audit rows and finish the current log file on shutdown
+    if prediction_log is not None:
+        prediction_log.close()
+
+
 app = FastAPI(
     title="Car Price Prediction API",
     description="An API to predict car prices using a machine learning model.",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -21,11 +53,49 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# "full" serves the 100-tree forest, "lite" the pruned and quantized variant
+MODEL_VARIANTS = {
+    "full": "car_price_model.joblib",
+    "lite": "car_price_model_lite.joblib",
+}
+model_variant = os.environ.get("MODEL_VARIANT", "full")
+if model_variant not in MODEL_VARIANTS:
+    raise ValueError(
+        f"Unknown MODEL_VARIANT '{model_variant}', "
+        f"expected one of: {', '.join(MODEL_VARIANTS)}"
+    )
+
 model_path = os.path.join(
-    os.path.dirname(__file__), "..", "..", "models", "car_price_model.joblib"
+    os.path.dirname(__file__), "..", "..", "models", MODEL_VARIANTS[model_variant]
 )
 model = joblib.load(model_path)
 
+with open(model_path, "rb") as f:
+    model_version = f"{model_variant}-{hashlib.sha256(f.read()).hexdigest()[:12]}"
+
+model_info_path = os.path.join(
+    os.path.dirname(__file__), "..", "..", "models", "car_price_model_info.joblib"
+)
+model_info = joblib.load(model_info_path)
+
+explainer = TreePathExplainer(model, model_info["feature_names"], FIELD_COLUMNS)
+
+# Models trained before reference distributions were saved run without it
+drift_monitor = (
+    DriftMonitor(
+        model_info["reference_distributions"],
+        labels={column: field for field, column in FIELD_COLUMNS.items()},
+    )
+    if "reference_distributions" in model_info
+    else None
+)
+
+# Optional audit log of inputs and predictions, enabled by PREDICTION_LOG_DIR
+prediction_log_dir = os.environ.get("PREDICTION_LOG_DIR")
+prediction_log = (
+    PredictionLog(prediction_log_dir, model_version) if prediction_log_dir else None
+)
+
 
 class CarFeatures(BaseModel):
     car_make: str = "Porsche"
@@ -50,6 +120,12 @@ class CarFeatures(BaseModel):
         }
 
 
+FIELD_TYPES = {
+    name: field.annotation for name, field in CarFeatures.model_fields.items()
+}
+car_features_list = TypeAdapter(List[CarFeatures])
+
+
 @app.get("/", response_class=HTMLResponse)
 def read_root():
     html_content = """
@@ -375,39 +451,112 @@ def health_check():
     return {
         "status": "ok",
         "model_loaded": True,
+        "model_variant": model_variant,
+        "model_version": model_version,
         "message": "Car Price Prediction API is running!",
+        "prediction_log": prediction_log.stats() if prediction_log else None,
     }
 
 
 @app.post("/predict")
 def predict_price(features: CarFeatures):
     try:
+        columns = features_to_columns([features])
+        prediction = model.predict(build_input_frame(columns))
+        if drift_monitor is not None:
+            drift_monitor.update(input_columns(columns))
+        predicted_price = round(prediction[0], 2)
+        if prediction_log is not None:
+            prediction_log.log(columns, [predicted_price])
+        return {"predicted_price_usd": predicted_price}
 
-        def process_engine_size(engine_size):
-            if engine_size == 0 or engine_size == 0.0:
-                return "Electric"
-            else:
-                return str(float(engine_size))
-
-        input_data = pd.DataFrame(
-            [
-                {
-                    "Car Make": str(features.car_make),
-                    "Car Model": str(features.car_model),
-                    "Year": float(features.year),
-                    "Engine Size (L)": process_engine_size(features.engine_size),
-                    "Horsepower": float(features.horsepower),
-                    "Torque (lb-ft)": float(features.torque),
-                    "0-60 MPH Time (seconds)": float(features.zero_to_sixty_time),
-                }
-            ]
+    except Exception as e:
+        return {"error": f"Prediction failed: {str(e)}", "predicted_price_usd": 0}
+
+
+def _decode_batch(body, binary):
+    if binary:
+        # Arrow columns go straight to arrays, validated per column
+        return decode_columns(body, FIELD_TYPES)
+    return features_to_columns(car_features_list.validate_json(body))
+
+
+def _predict_batch(columns):
+    if len(columns["car_make"]) == 0:
+        return np.empty(0)
+    input_data = build_input_frame(columns)
+    predictions = np.round(model.predict(input_data), 2)
+    if drift_monitor is not None:
+        drift_monitor.update(input_data)
+    if prediction_log is not None:
+        prediction_log.log(columns, predictions)
+    return predictions
+
+
+@app.post("/predict/batch")
+async def predict_price_batch(request: Request):
+    content_type = request.headers.get("content-type", "")
+    accept = request.headers.get("accept", "")
+    binary = content_type.startswith(ARROW_STREAM)
+    # Answer in the request's format unless the client asks for another one
+    binary_response = arrow_available() and (
+        ARROW_STREAM in accept or (binary and "application/json" not in accept)
+    )
+
+    body = await request.body()
+    try:
+        columns = await run_in_threadpool(_decode_batch, body, binary)
+    except ValidationError as e:
+        return JSONResponse(
+            status_code=422, content={"detail": jsonable_encoder(e.errors())}
         )
+    except ValueError as e:
+        # Also covers corrupt Arrow streams (pyarrow.ArrowInvalid)
+        return JSONResponse(status_code=422, content={"detail": str(e)})
+
+    try:
+        predictions = await run_in_threadpool(_predict_batch, columns)
+    except Exception as e:
+        return {"error": f"Prediction failed: {str(e)}", "predicted_price_usd": []}
 
-        prediction = model.predict(input_data)
-        return {"predicted_price_usd": round(prediction[0], 2)}
+    if binary_response:
+        return Response(encode_predictions(predictions), media_type=ARROW_STREAM)
+    return {"predicted_price_usd": predictions.tolist()}
+
+
+@app.get("/drift")
+def drift_scores():
+    if drift_monitor is None:
+        return {
+            "enabled": False,
+            "message": "Model info has no reference distributions; retrain to enable",
+        }
+    return {"enabled": True, **drift_monitor.scores()}
+
+
+@app.post("/drift/reset")
+def reset_drift():
+    if drift_monitor is not None:
+        drift_monitor.reset()
+    return {"enabled": drift_monitor is not None}
+
+
+@app.post("/explain")
+def explain_price(features: CarFeatures):
+    try:
+        input_data = build_input_frame(features_to_columns([features]))
+        predictions, contributions = explainer.explain(input_data)
+        return {
+            "predicted_price_usd": round(float(predictions[0]), 2),
+            "base_price_usd": round(explainer.base_value, 2),
+            "contributions_usd": {
+                field: round(float(value), 2)
+                for field, value in zip(explainer.fields, contributions[0])
+            },
+        }
 
     except Exception as e:
-        return {"error": f"Prediction failed: {str(e)}", "predicted_price_usd": 0}
+        return {"error": f"Explanation failed: {str(e)}", "predicted_price_usd": 0}
 
 
 if __name__ == "__main__":
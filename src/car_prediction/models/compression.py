@@ -0,0 +1,184 @@
+"""
+Compression of the trained random forest into a "lite" serving model.
+
+The forest is pruned to the K trees with the lowest out-of-bag error, and the
+surviving trees are packed into flat NumPy arrays. Thresholds and leaf
+values can optionally be quantized (float32, or int16 leaf values with a
+linear scale). Prediction walks every tree for every row at once, one
+vectorized step per tree level, instead of one Python-level call per tree.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+from sklearn.base import BaseEstimator, RegressorMixin
+from sklearn.metrics import mean_absolute_error
+from sklearn.pipeline import Pipeline
+
+QUANTIZE_OPTIONS = (None, "float32", "int16")
+
+# Per-tree node arrays with local node ids, as used by the explainer
+TreeArrays = namedtuple(
+    "TreeArrays", ["children_left", "children_right", "feature", "value"]
+)
+
+
+def rank_trees_by_oob_error(forest, X_train, y_train):
+    """
+    Return tree indices sorted by each tree's out-of-bag MAE, best first.
+
+    Each tree is scored on the training rows its bootstrap sample left out,
+    so the ranking needs no extra held-out split.
+    """
+    X_train = np.asarray(X_train, dtype=np.float32)
+    y_train = np.asarray(y_train, dtype=float)
+    n_samples = X_train.shape[0]
+
+    errors = []
+    for estimator, samples in zip(forest.estimators_, forest.estimators_samples_):
+        oob = np.ones(n_samples, dtype=bool)
+        oob[samples] = False
+        if not oob.any():
+            errors.append(np.inf)
+            continue
+        errors.append(
+            mean_absolute_error(y_train[oob], estimator.predict(X_train[oob]))
+        )
+
+    return np.argsort(errors, kind="stable")
+
+
+def _round_down_to_float32(thresholds):
+    """
+    Cast thresholds to the largest float32 not above them.
+
+    sklearn puts each threshold at a float64 midpoint between two float32
+    feature values. Rounding to nearest can land on the upper value, which
+    would send rows holding exactly that value left instead of right; for
+    float32 inputs, ``x <= threshold`` is unchanged when rounding down.
+    """
+    rounded = thresholds.astype(np.float32)
+    return np.where(
+        rounded > thresholds, np.nextafter(rounded, np.float32(-np.inf)), rounded
+    )
+
+
+class LiteForestRegressor(RegressorMixin, BaseEstimator):
+    """
+    Pruned, flat-array random forest for low-latency prediction.
+
+    Build it with :meth:`from_forest`; it is not trained directly.
+    """
+
+    def __init__(self, quantize=None):
+        self.quantize = quantize
+
+    @classmethod
+    def from_forest(cls, forest, tree_indices, quantize=None):
+        if quantize not in QUANTIZE_OPTIONS:
+            raise ValueError(f"quantize must be one of {QUANTIZE_OPTIONS}")
+
+        lite = cls(quantize=quantize)
+        trees = [forest.estimators_[i].tree_ for i in tree_indices]
+        node_counts = np.array([tree.node_count for tree in trees])
+        offsets = np.concatenate([[0], np.cumsum(node_counts)[:-1]])
+
+        children_left = []
+        children_right = []
+        for tree, offset in zip(trees, offsets):
+            node_ids = np.arange(tree.node_count)
+            is_leaf = tree.children_left == -1
+            # Leaves point at themselves, so walking past a leaf is a no-op
+            # and every row can take the same number of steps.
+            children_left.append(
+                np.where(is_leaf, node_ids, tree.children_left) + offset
+            )
+            children_right.append(
+                np.where(is_leaf, node_ids, tree.children_right) + offset
+            )
+
+        thresholds = np.concatenate([tree.threshold for tree in trees])
+        if quantize is not None:
+            thresholds = _round_down_to_float32(thresholds)
+
+        lite.roots_ = offsets.astype(np.int32)
+        lite.children_left_ = np.concatenate(children_left).astype(np.int32)
+        lite.children_right_ = np.concatenate(children_right).astype(np.int32)
+        lite.feature_ = np.concatenate(
+            [np.maximum(tree.feature, 0) for tree in trees]
+        ).astype(np.int32)
+        lite.threshold_ = thresholds
+        lite.max_depth_ = max(tree.max_depth for tree in trees)
+        lite.n_estimators_ = len(trees)
+        lite.n_features_in_ = forest.n_features_in_
+        lite._set_values(np.concatenate([tree.value[:, 0, 0] for tree in trees]))
+        return lite
+
+    def _set_values(self, values):
+        if self.quantize == "int16":
+            low, high = values.min(), values.max()
+            self.value_scale_ = max((high - low) / 65535.0, np.finfo(float).tiny)
+            self.value_offset_ = low
+            self.value_ = (np.round((values - low) / self.value_scale_) - 32768).astype(
+                np.int16
+            )
+        elif self.quantize == "float32":
+            self.value_ = values.astype(np.float32)
+        else:
+            self.value_ = values.astype(np.float64)
+
+    def _node_values(self, nodes):
+        values = self.value_[nodes].astype(np.float64)
+        if self.quantize == "int16":
+            values = (values + 32768) * self.value_scale_ + self.value_offset_
+        return values
+
+    def apply(self, X):
+        """
+        Return the leaf reached in each tree, as local node ids per tree.
+        """
+        X = np.asarray(X, dtype=np.float32)
+        rows = np.arange(X.shape[0])[:, None]
+        nodes = np.broadcast_to(self.roots_, (X.shape[0], self.n_estimators_))
+
+        for _ in range(self.max_depth_):
+            go_left = X[rows, self.feature_[nodes]] <= self.threshold_[nodes]
+            nodes = np.where(
+                go_left, self.children_left_[nodes], self.children_right_[nodes]
+            )
+
+        return nodes - self.roots_
+
+    def predict(self, X):
+        leaves = self.apply(X) + self.roots_
+        return self._node_values(leaves).mean(axis=1)
+
+    def tree_arrays(self):
+        """
+        Yield each tree's node arrays with local ids and ``-1`` for leaf children.
+        """
+        ends = np.append(self.roots_[1:], len(self.value_))
+        for start, end in zip(self.roots_, ends):
+            node_ids = np.arange(end - start)
+            left = self.children_left_[start:end] - start
+            right = self.children_right_[start:end] - start
+            is_leaf = left == node_ids
+            yield TreeArrays(
+                children_left=np.where(is_leaf, -1, left),
+                children_right=np.where(is_leaf, -1, right),
+                feature=self.feature_[start:end],
+                value=self._node_values(np.arange(start, end)),
+            )
+
+
+def compress_pipeline(pipeline, X_train, y_train, n_trees, quantize=None):
+    """
+    Build a lite pipeline sharing the fitted preprocessor with ``pipeline``.
+    """
+    preprocessor = pipeline.named_steps["preprocessor"]
+    forest = pipeline.named_steps["regressor"]
+
+    ranking = rank_trees_by_oob_error(forest, preprocessor.transform(X_train), y_train)
+    lite = LiteForestRegressor.from_forest(forest, ranking[:n_trees], quantize)
+
+    return Pipeline(steps=[("preprocessor", preprocessor), ("regressor", lite)])
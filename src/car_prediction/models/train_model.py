@@ -10,9 +10,13 @@ from sklearn.pipeline import Pipeline
 from sklearn.metrics import mean_absolute_error, r2_score
 import joblib
 import re
+import time
 import warnings
 import os
 
+from car_prediction.drift import build_reference_distributions
+from car_prediction.models.compression import compress_pipeline
+
 warnings.filterwarnings("ignore")
 
 
@@ -148,6 +152,18 @@ def clean_engine_size_column(series):
     return series.apply(clean_engine)
 
 
+def time_predictions(estimator, X, repeats=20):
+    """
+    Best-of-N wall time for an estimator's predict call on X
+    """
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        estimator.predict(X)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
 # 1. Load Data
 print("Loading data...")
 data_path = os.path.join(
@@ -315,6 +331,50 @@ model_path = os.path.join(models_dir, "car_price_model.joblib")
 joblib.dump(model, model_path)
 print(f"Model saved to {model_path}")
 
+# 9. Model Compression
+print("\n=== Compressing Model ===")
+
+# Lite variant for the latency-critical tier: the best trees by out-of-bag
+# error, with float32 thresholds and int16 leaf values
+lite_n_trees = 20
+lite_quantize = "int16"
+
+lite_model = compress_pipeline(
+    model, X_train, y_train, n_trees=lite_n_trees, quantize=lite_quantize
+)
+y_pred_lite = lite_model.predict(X_test)
+lite_mae = mean_absolute_error(y_test, y_pred_lite)
+lite_r2 = r2_score(y_test, y_pred_lite)
+
+# Time the forests alone: both variants share the same preprocessor
+X_test_encoded = model.named_steps["preprocessor"].transform(X_test)
+full_forest = model.named_steps["regressor"]
+lite_forest = lite_model.named_steps["regressor"]
+batch_speedup = time_predictions(full_forest, X_test_encoded) / time_predictions(
+    lite_forest, X_test_encoded
+)
+single_row_speedup = time_predictions(
+    full_forest, X_test_encoded[:1]
+) / time_predictions(lite_forest, X_test_encoded[:1])
+
+print(f"Kept {lite_n_trees} of {len(full_forest.estimators_)} trees")
+print(f"Lite Test MAE: ${lite_mae:,.2f} (delta ${lite_mae - test_mae:+,.2f})")
+print(f"Lite Test R²: {lite_r2:.4f} (delta {lite_r2 - test_r2:+.4f})")
+print(f"Speedup: {batch_speedup:.1f}x batch, {single_row_speedup:.1f}x single row")
+
+lite_model_path = os.path.join(models_dir, "car_price_model_lite.joblib")
+joblib.dump(lite_model, lite_model_path)
+print(f"Lite model saved to {lite_model_path}")
+print(
+    f"Artifact size: {os.path.getsize(model_path):,} bytes full, "
+    f"{os.path.getsize(lite_model_path):,} bytes lite"
+)
+
+# Reference input distributions for the serving-time drift monitor
+reference_distributions = build_reference_distributions(
+    X_train, numeric_features, categorical_features
+)
+
 # Save feature information for later use
 model_info = {
     "features": features,
@@ -327,6 +387,18 @@ model_info = {
         "train_r2": train_r2,
         "test_r2": test_r2,
     },
+    "lite_model": {
+        "n_estimators": lite_n_trees,
+        "quantize": lite_quantize,
+        "test_mae": lite_mae,
+        "test_r2": lite_r2,
+        "mae_delta": lite_mae - test_mae,
+        "r2_delta": lite_r2 - test_r2,
+        "batch_speedup": batch_speedup,
+        "single_row_speedup": single_row_speedup,
+        "size_bytes": os.path.getsize(lite_model_path),
+    },
+    "reference_distributions": reference_distributions,
 }
 
 model_info_path = os.path.join(models_dir, "car_price_model_info.joblib")
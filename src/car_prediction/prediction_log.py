@@ -0,0 +1,273 @@
+"""
+Append-only audit log of prediction inputs and outputs.
+
+Request handlers only append a reference to their columns to an in-memory
+buffer; a background thread drains the buffer in batches into rotating
+Arrow IPC stream files (``predictions-*.arrows``). The buffer is bounded:
+when it is full, new rows are dropped and counted rather than blocking the
+request.
+
+Every flushed batch is appended to the current file and fsynced, and an
+Arrow stream is readable up to its last complete batch without a footer.
+An unclean exit (crash, OOM kill, SIGKILL) therefore only loses rows still
+in memory: at most ``flush_interval`` seconds of traffic, capped at
+``max_buffered_rows``, plus any batch that was mid-write.
+
+pyarrow is an optional dependency (``pip install -e ".[arrow]"``).
+"""
+
+import glob
+import os
+import threading
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from car_prediction.features import FIELD_COLUMNS, build_input_frame
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+
+STRING_FIELDS = ("car_make", "car_model")
+
+
+def _log_schema():
+    fields = [
+        pa.field(name, pa.string() if name in STRING_FIELDS else pa.float64())
+        for name in FIELD_COLUMNS
+    ]
+    fields += [
+        pa.field("predicted_price_usd", pa.float64()),
+        pa.field("model_version", pa.string()),
+        pa.field("logged_at", pa.timestamp("ms", tz="UTC")),
+    ]
+    return pa.schema(fields)
+
+
+class PredictionLog:
+    """
+    Buffered, non-blocking writer for the prediction audit log.
+    """
+
+    def __init__(
+        self,
+        directory,
+        model_version,
+        max_buffered_rows=100_000,
+        batch_rows=1_000,
+        flush_interval=5.0,
+        rows_per_file=100_000,
+        seconds_per_file=600.0,
+    ):
+        if pa is None:
+            raise RuntimeError(
+                "The prediction log requires pyarrow; "
+                'install with pip install -e ".[arrow]"'
+            )
+
+        self.directory = directory
+        self.model_version = model_version
+        self.max_buffered_rows = max_buffered_rows
+        self.batch_rows = batch_rows
+        self.flush_interval = flush_interval
+        self.rows_per_file = rows_per_file
+        self.seconds_per_file = seconds_per_file
+        os.makedirs(directory, exist_ok=True)
+
+        self._schema = _log_schema()
+        self._lock = threading.Lock()
+        self._buffer = []
+        self._buffered_rows = 0
+        self._written_rows = 0
+        self._dropped_rows = 0
+        self._files_written = 0
+        self._failed_writes = 0
+
+        self._file = None
+        self._writer = None
+        self._file_rows = 0
+        self._file_opened_at = 0.0
+
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="prediction-log-writer", daemon=True
+        )
+        self._thread.start()
+
+    def log(self, columns, predictions):
+        """
+        Queue one or more predictions; never blocks on I/O.
+
+        ``columns`` maps each ``CarFeatures`` field to a sequence of values,
+        aligned with ``predictions``.
+        """
+        n_rows = len(predictions)
+        chunk = (columns, predictions, time.time())
+
+        with self._lock:
+            if self._buffered_rows + n_rows > self.max_buffered_rows:
+                self._dropped_rows += n_rows
+                return
+            self._buffer.append(chunk)
+            self._buffered_rows += n_rows
+            full_batch = self._buffered_rows >= self.batch_rows
+
+        if full_batch:
+            self._wake.set()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "buffered_rows": self._buffered_rows,
+                "written_rows": self._written_rows,
+                "dropped_rows": self._dropped_rows,
+                "files_written": self._files_written,
+                "failed_writes": self._failed_writes,
+            }
+
+    def close(self):
+        """
+        Stop the writer thread, flush whatever is buffered and finish the file.
+        """
+        self._stop.set()
+        self._wake.set()
+        self._thread.join()
+        self._flush()
+        self._close_file()
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self._flush()
+
+    def _flush(self):
+        with self._lock:
+            chunks, self._buffer = self._buffer, []
+            n_rows, self._buffered_rows = self._buffered_rows, 0
+
+        if chunks:
+            try:
+                self._write(self._to_table(chunks))
+            except Exception:
+                # The file may end in a torn batch; readers stop there, and
+                # the next batch starts a fresh file.
+                self._close_file()
+                with self._lock:
+                    self._failed_writes += 1
+                    self._dropped_rows += n_rows
+                return
+
+        with self._lock:
+            self._written_rows += n_rows
+
+        if self._writer is not None and (
+            self._file_rows >= self.rows_per_file
+            or time.time() - self._file_opened_at >= self.seconds_per_file
+        ):
+            self._close_file()
+
+    def _to_table(self, chunks):
+        arrays = {}
+        for name in FIELD_COLUMNS:
+            dtype = object if name in STRING_FIELDS else float
+            arrays[name] = np.concatenate(
+                [np.asarray(columns[name], dtype=dtype) for columns, _, _ in chunks]
+            )
+        arrays["predicted_price_usd"] = np.concatenate(
+            [np.asarray(predictions, dtype=float) for _, predictions, _ in chunks]
+        )
+        n_rows = len(arrays["predicted_price_usd"])
+        arrays["model_version"] = np.full(n_rows, self.model_version, dtype=object)
+        arrays["logged_at"] = np.concatenate(
+            [
+                np.full(len(predictions), int(logged_at * 1000))
+                for _, predictions, logged_at in chunks
+            ]
+        )
+        return pa.Table.from_pydict(arrays, schema=self._schema)
+
+    def _write(self, table):
+        if self._writer is None:
+            stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+            path = os.path.join(self.directory, f"predictions-{stamp}.arrows")
+            self._file = open(path, "wb")
+            self._writer = pa.ipc.new_stream(self._file, self._schema)
+            self._file_rows = 0
+            self._file_opened_at = time.time()
+            with self._lock:
+                self._files_written += 1
+
+        self._writer.write_table(table)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file_rows += table.num_rows
+
+    def _close_file(self):
+        if self._file is None:
+            return
+        try:
+            self._writer.close()
+        except Exception:
+            pass
+        finally:
+            self._file.close()
+            self._file = None
+            self._writer = None
+
+
+def _read_stream(path):
+    """
+    Read every complete batch of a log file, stopping at a torn tail.
+    """
+    batches = []
+    try:
+        with pa.OSFile(path, "rb") as source:
+            reader = pa.ipc.open_stream(source)
+            while True:
+                try:
+                    batches.append(reader.read_next_batch())
+                except StopIteration:
+                    break
+    except (pa.ArrowInvalid, OSError):
+        pass
+    return batches
+
+
+def read_prediction_log(directory):
+    """
+    Load the log as a DataFrame with ``train_model.py`` input columns.
+
+    Inputs use the training column names, followed by the model's own output
+    in ``Predicted Price (in USD)``, then ``Model Version`` and ``Logged At``.
+    There is no ``Price (in USD)`` target: join the real sale prices onto
+    that column before retraining. Never train on the logged predictions,
+    or the model ends up learning its own output.
+
+    Files still being written are included up to their last complete batch.
+    """
+    if pa is None:
+        raise RuntimeError(
+            "Reading the prediction log requires pyarrow; "
+            'install with pip install -e ".[arrow]"'
+        )
+
+    paths = sorted(glob.glob(os.path.join(directory, "predictions-*.arrows")))
+    batches = [batch for path in paths for batch in _read_stream(path)]
+    if not batches:
+        columns = list(FIELD_COLUMNS.values())
+        return pd.DataFrame(
+            columns=columns + ["Predicted Price (in USD)", "Model Version", "Logged At"]
+        )
+
+    log = pa.Table.from_batches(batches, schema=_log_schema()).to_pandas()
+    data = build_input_frame({name: log[name].to_numpy() for name in FIELD_COLUMNS})
+    data["Predicted Price (in USD)"] = log["predicted_price_usd"]
+    data["Model Version"] = log["model_version"]
+    data["Logged At"] = log["logged_at"]
+    return data
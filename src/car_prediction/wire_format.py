@@ -0,0 +1,89 @@
+"""
+Columnar binary request/response format for high-volume batch callers.
+
+Batches are exchanged as Apache Arrow IPC streams. A request carries one
+column per ``CarFeatures`` field; the response carries a single
+``predicted_price_usd`` column. Decoding goes straight from the Arrow
+buffers to NumPy arrays, so no per-row Python objects are built.
+
+pyarrow is an optional dependency (``pip install -e ".[arrow]"``); without
+it only JSON is accepted.
+"""
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+
+ARROW_STREAM = "application/vnd.apache.arrow.stream"
+
+
+def arrow_available():
+    return pa is not None
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise RuntimeError(
+            f"{ARROW_STREAM} requires pyarrow; install with "
+            'pip install -e ".[arrow]"'
+        )
+
+
+def decode_columns(body, field_types):
+    """
+    Decode an Arrow IPC stream into ``{field: numpy array}``.
+
+    ``field_types`` maps each expected field to its Python type (``str``,
+    ``int`` or ``float``); numeric columns are cast to float64 and string
+    columns to NumPy object arrays. Numeric values must be finite, and
+    ``int`` fields whole numbers, as the JSON path requires.
+
+    Raises ``ValueError`` for a corrupt stream or invalid columns.
+    """
+    _require_pyarrow()
+    try:
+        table = pa.ipc.open_stream(body).read_all()
+    except pa.ArrowInvalid as e:
+        raise ValueError(f"Invalid Arrow stream: {e}") from e
+
+    missing = [field for field in field_types if field not in table.column_names]
+    if missing:
+        raise ValueError(f"Missing columns: {', '.join(missing)}")
+
+    columns = {}
+    for field, field_type in field_types.items():
+        column = table.column(field)
+        if column.null_count:
+            raise ValueError(f"Column '{field}' contains nulls")
+        if field_type is str:
+            columns[field] = column.cast(pa.string()).to_numpy(zero_copy_only=False)
+            continue
+
+        try:
+            values = column.cast(pa.float64()).to_numpy()
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+            raise ValueError(f"Column '{field}' is not numeric") from e
+        if not np.isfinite(values).all():
+            raise ValueError(f"Column '{field}' contains non-finite values")
+        if field_type is int and (values != np.floor(values)).any():
+            raise ValueError(f"Column '{field}' must contain integers")
+        columns[field] = values
+    return columns
+
+
+def encode_predictions(predictions):
+    """
+    Encode predictions as an Arrow IPC stream with a ``predicted_price_usd`` column.
+    """
+    _require_pyarrow()
+    batch = pa.record_batch(
+        [pa.array(np.asarray(predictions, dtype=np.float64))],
+        names=["predicted_price_usd"],
+    )
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, batch.schema) as writer:
+        writer.write_batch(batch)
+    return sink.getvalue().to_pybytes()
@@ -0,0 +1,56 @@
+import os
+
+import joblib
+import numpy as np
+import pytest
+
+from car_prediction.features import FIELD_COLUMNS, build_input_frame
+
+MODELS_DIR = os.path.join(os.path.dirname(__file__), "..", "models")
+
+
+@pytest.fixture(scope="session")
+def full_pipeline():
+    return joblib.load(os.path.join(MODELS_DIR, "car_price_model.joblib"))
+
+
+@pytest.fixture(scope="session")
+def lite_pipeline():
+    return joblib.load(os.path.join(MODELS_DIR, "car_price_model_lite.joblib"))
+
+
+@pytest.fixture(scope="session")
+def model_info():
+    return joblib.load(os.path.join(MODELS_DIR, "car_price_model_info.joblib"))
+
+
+@pytest.fixture(scope="session")
+def input_data(model_info):
+    """
+    Synthetic requests drawn from the training categories and ranges.
+    """
+    rng = np.random.default_rng(0)
+    reference = model_info["reference_distributions"]
+    n_rows = 500
+
+    columns = {}
+    for field, column in FIELD_COLUMNS.items():
+        if column in reference["categorical"]:
+            categories = reference["categorical"][column]["categories"]
+            columns[field] = rng.choice(categories, n_rows)
+        else:
+            ref = reference["numeric"][column]
+            columns[field] = rng.uniform(ref["low"], ref["high"], n_rows)
+
+    # Engine sizes are categorical in the model but numeric in the API
+    columns["engine_size"] = [_engine_size(value) for value in columns["engine_size"]]
+    return build_input_frame(columns)
+
+
+def _engine_size(category):
+    if category == "Electric":
+        return 0.0
+    try:
+        return float(category)
+    except ValueError:
+        return 3.0
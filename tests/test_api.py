@@ -0,0 +1,126 @@
+import pyarrow as pa
+import pytest
+from fastapi.testclient import TestClient
+
+from car_prediction.main import FIELD_TYPES, CarFeatures, app
+from car_prediction.wire_format import ARROW_STREAM
+
+
+@pytest.fixture(scope="module")
+def client():
+    return TestClient(app)
+
+
+def arrow_stream(columns):
+    table = pa.table(
+        {
+            field: pa.array(
+                columns[field], pa.string() if kind is str else pa.float64()
+            )
+            for field, kind in FIELD_TYPES.items()
+        }
+    )
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def test_batch_json_matches_single_predictions(client):
+    rows = [{}, {"car_make": "Ferrari", "car_model": "488 GTB", "engine_size": 3.9}]
+
+    batch = client.post("/predict/batch", json=rows).json()
+
+    assert batch["predicted_price_usd"] == [
+        client.post("/predict", json=row).json()["predicted_price_usd"] for row in rows
+    ]
+
+
+def test_batch_arrow_round_trip(client):
+    rows = [{}, {"car_make": "Ferrari", "car_model": "488 GTB", "engine_size": 3.9}]
+    expected = client.post("/predict/batch", json=rows).json()["predicted_price_usd"]
+    columns = {
+        field: [row.get(field, info.default) for row in rows]
+        for field, info in CarFeatures.model_fields.items()
+    }
+
+    response = client.post(
+        "/predict/batch",
+        content=arrow_stream(columns),
+        headers={"content-type": ARROW_STREAM},
+    )
+
+    assert response.headers["content-type"] == ARROW_STREAM
+    table = pa.ipc.open_stream(response.content).read_all()
+    assert table.column("predicted_price_usd").to_pylist() == expected
+
+
+def test_empty_json_batch(client):
+    response = client.post("/predict/batch", json=[])
+
+    assert response.json() == {"predicted_price_usd": []}
+
+
+def test_empty_arrow_batch(client):
+    columns = {field: [] for field in FIELD_TYPES}
+
+    response = client.post(
+        "/predict/batch",
+        content=arrow_stream(columns),
+        headers={"content-type": ARROW_STREAM},
+    )
+
+    assert response.headers["content-type"] == ARROW_STREAM
+    table = pa.ipc.open_stream(response.content).read_all()
+    assert table.num_rows == 0
+
+
+def default_columns(n_rows=2):
+    return {
+        field: [info.default] * n_rows
+        for field, info in CarFeatures.model_fields.items()
+    }
+
+
+@pytest.mark.parametrize(
+    "field, value",
+    [("horsepower", float("nan")), ("year", float("inf")), ("torque", 331.5)],
+)
+def test_invalid_arrow_values_are_rejected(client, field, value):
+    columns = default_columns()
+    columns[field][1] = value
+
+    response = client.post(
+        "/predict/batch",
+        content=arrow_stream(columns),
+        headers={"content-type": ARROW_STREAM, "accept": ARROW_STREAM},
+    )
+
+    assert response.status_code == 422
+    assert field in response.json()["detail"]
+
+
+def test_corrupt_arrow_stream_is_rejected(client):
+    body = arrow_stream(default_columns())
+
+    response = client.post(
+        "/predict/batch",
+        content=body[: len(body) // 2],
+        headers={"content-type": ARROW_STREAM},
+    )
+
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize(
+    "body", [b"[{", b'[{"horsepower": "nan"}]', b'{"car_make": "Porsche"}']
+)
+def test_invalid_json_batch_is_rejected(client, body):
+    response = client.post(
+        "/predict/batch",
+        content=body,
+        headers={"content-type": "application/json", "accept": ARROW_STREAM},
+    )
+
+    assert response.status_code == 422
+    assert response.headers["content-type"] == "application/json"
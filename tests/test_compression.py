@@ -0,0 +1,99 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from car_prediction.models.compression import LiteForestRegressor
+
+TREE_INDICES = list(range(0, 100, 5))
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+NUMERIC_COLUMNS = ["Year", "Horsepower", "Torque (lb-ft)", "0-60 MPH Time (seconds)"]
+
+
+@pytest.fixture(scope="module")
+def encoded(full_pipeline, input_data):
+    return full_pipeline.named_steps["preprocessor"].transform(input_data)
+
+
+@pytest.fixture(scope="module")
+def forest(full_pipeline):
+    return full_pipeline.named_steps["regressor"]
+
+
+def subforest_predict(forest, X):
+    return np.mean([forest.estimators_[i].predict(X) for i in TREE_INDICES], axis=0)
+
+
+def test_unquantized_matches_subforest(forest, encoded):
+    lite = LiteForestRegressor.from_forest(forest, TREE_INDICES)
+
+    np.testing.assert_allclose(
+        lite.predict(encoded), subforest_predict(forest, encoded), rtol=1e-9
+    )
+
+
+def test_apply_matches_sklearn_leaves(forest, encoded):
+    lite = LiteForestRegressor.from_forest(forest, TREE_INDICES)
+    expected = np.stack(
+        [forest.estimators_[i].apply(encoded.astype(np.float32)) for i in TREE_INDICES],
+        axis=1,
+    )
+
+    np.testing.assert_array_equal(lite.apply(encoded), expected)
+
+
+def test_float32_error_is_bounded(forest, encoded):
+    lite = LiteForestRegressor.from_forest(forest, TREE_INDICES, "float32")
+    error = np.abs(lite.predict(encoded) - subforest_predict(forest, encoded))
+
+    assert error.max() <= 0.1
+
+
+def test_int16_error_is_within_half_a_quantization_step(forest, encoded):
+    lite = LiteForestRegressor.from_forest(forest, TREE_INDICES, "int16")
+    error = np.abs(lite.predict(encoded) - subforest_predict(forest, encoded))
+
+    assert error.max() <= lite.value_scale_ / 2 + 0.1
+
+
+def test_rejects_unknown_quantize_mode(forest):
+    with pytest.raises(ValueError):
+        LiteForestRegressor.from_forest(forest, TREE_INDICES, quantize="int8")
+
+
+def test_lite_artifact_serves_through_pipeline(lite_pipeline, input_data):
+    predictions = lite_pipeline.predict(input_data)
+
+    assert predictions.shape == (len(input_data),)
+    assert np.isfinite(predictions).all()
+
+
+@pytest.fixture(scope="module")
+def encoded_dataset(full_pipeline):
+    """
+    Dataset rows with exact training values, where float32 rounding of a
+    threshold onto a neighbouring value would change the branch taken.
+    """
+    data = pd.read_csv(os.path.join(DATA_DIR, "sport_car_price.csv"))
+    data.columns = data.columns.str.strip()
+    data[NUMERIC_COLUMNS] = data[NUMERIC_COLUMNS].apply(pd.to_numeric, errors="coerce")
+    data = data.dropna(subset=NUMERIC_COLUMNS)
+    return full_pipeline.named_steps["preprocessor"].transform(data)
+
+
+@pytest.mark.parametrize("quantize", ["float32", "int16"])
+def test_quantized_apply_matches_sklearn_on_dataset_rows(
+    forest, encoded_dataset, quantize
+):
+    lite = LiteForestRegressor.from_forest(forest, TREE_INDICES, quantize)
+    expected = np.stack(
+        [
+            forest.estimators_[i].apply(encoded_dataset.astype(np.float32))
+            for i in TREE_INDICES
+        ],
+        axis=1,
+    )
+
+    np.testing.assert_array_equal(lite.apply(encoded_dataset), expected)
@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from car_prediction.drift import DriftMonitor
+from car_prediction.features import (
+    build_input_frame,
+    features_to_columns,
+    input_columns,
+)
+from car_prediction.main import CarFeatures
+
+
+@pytest.fixture
+def reference(model_info):
+    return model_info["reference_distributions"]
+
+
+def sample_reference(reference, n_rows, seed=0):
+    """
+    Draw rows from the saved reference distributions themselves.
+    """
+    rng = np.random.default_rng(seed)
+    data = {}
+    for column, ref in reference["numeric"].items():
+        bounds = [ref["low"]] + ref["edges"] + [ref["high"]]
+        bins = rng.choice(len(ref["proportions"]), n_rows, p=ref["proportions"])
+        # Draw inside each bin; edges are inclusive on the right bin
+        data[column] = [
+            bounds[b] if bounds[b] == bounds[b + 1] else rng.uniform(*bounds[b : b + 2])
+            for b in bins
+        ]
+    for column, ref in reference["categorical"].items():
+        proportions = np.asarray(ref["proportions"])
+        data[column] = rng.choice(
+            ref["categories"], n_rows, p=proportions / proportions.sum()
+        )
+    return pd.DataFrame(data)
+
+
+def test_no_data(reference):
+    assert DriftMonitor(reference).scores()["status"] == "no_data"
+
+
+def test_single_request_is_insufficient_data(reference):
+    monitor = DriftMonitor(reference)
+    monitor.update(input_columns(features_to_columns([CarFeatures()])))
+
+    scores = monitor.scores()
+    assert scores["observed_rows"] == 1
+    assert scores["status"] == "insufficient_data"
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_in_distribution_traffic_is_stable(reference, seed):
+    monitor = DriftMonitor(reference)
+    monitor.update(sample_reference(reference, 1000, seed))
+
+    assert monitor.scores()["status"] == "stable"
+
+
+def test_shifted_horsepower_is_significant(reference):
+    data = sample_reference(reference, 1000)
+    data["Horsepower"] = np.asarray(data["Horsepower"]) * 1.5
+    monitor = DriftMonitor(reference, labels={"Horsepower": "horsepower"})
+    monitor.update(data)
+
+    scores = monitor.scores()
+    assert scores["status"] == "significant"
+    assert scores["features"]["horsepower"]["above_range_rate"] > 0
+
+
+def test_unknown_makes_raise_drift(reference):
+    data = sample_reference(reference, 1000)
+    data.loc[:299, "Car Make"] = "Unheard Of Motors"
+    monitor = DriftMonitor(reference)
+    monitor.update(data)
+
+    scores = monitor.scores()
+    assert scores["features"]["Car Make"]["unknown_rate"] == pytest.approx(0.3)
+    assert scores["status"] == "significant"
+
+
+def test_row_and_batch_updates_agree(reference):
+    rows = [
+        CarFeatures(),
+        CarFeatures(car_make="Foo", engine_size=0, horsepower=5000),
+        CarFeatures(car_model="Huracan", year=2010),
+    ] * 10
+    by_row = DriftMonitor(reference)
+    for row in rows:
+        by_row.update(input_columns(features_to_columns([row])))
+    batched = DriftMonitor(reference)
+    batched.update(build_input_frame(features_to_columns(rows)))
+
+    assert by_row.scores() == batched.scores()
@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from car_prediction.explain import TreePathExplainer, map_features_to_fields
+from car_prediction.features import FIELD_COLUMNS
+
+
+@pytest.mark.parametrize("variant", ["full_pipeline", "lite_pipeline"])
+def test_contributions_add_up_to_prediction(request, model_info, input_data, variant):
+    pipeline = request.getfixturevalue(variant)
+    explainer = TreePathExplainer(pipeline, model_info["feature_names"], FIELD_COLUMNS)
+
+    predictions, contributions = explainer.explain(input_data)
+
+    assert contributions.shape == (len(input_data), len(FIELD_COLUMNS))
+    np.testing.assert_allclose(
+        explainer.base_value + contributions.sum(axis=1),
+        pipeline.predict(input_data),
+        rtol=1e-9,
+    )
+    np.testing.assert_allclose(predictions, pipeline.predict(input_data), rtol=1e-9)
+
+
+def test_one_hot_features_map_back_to_fields():
+    feature_names = ["Year", "Car Make_Porsche", "Car Model_911", "Engine Size (L)_3.0"]
+
+    field_index = map_features_to_fields(feature_names, FIELD_COLUMNS)
+
+    fields = list(FIELD_COLUMNS)
+    assert [fields[i] for i in field_index] == [
+        "year",
+        "car_make",
+        "car_model",
+        "engine_size",
+    ]
+
+
+def test_unmapped_feature_is_rejected():
+    with pytest.raises(ValueError):
+        map_features_to_fields(["Colour_Red"], FIELD_COLUMNS)
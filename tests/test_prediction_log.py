@@ -0,0 +1,127 @@
+import glob
+import os
+import time
+
+import pyarrow as pa
+import pytest
+
+from car_prediction.features import FIELD_COLUMNS
+from car_prediction.prediction_log import PredictionLog, read_prediction_log
+
+ROW = {
+    "car_make": ["Porsche"],
+    "car_model": ["911"],
+    "year": [2022],
+    "engine_size": [0.0],
+    "horsepower": [379],
+    "torque": [331],
+    "zero_to_sixty_time": [4.0],
+}
+
+
+@pytest.fixture
+def log(tmp_path):
+    # Every logged row wakes the writer thread
+    log = PredictionLog(str(tmp_path), "test-model", batch_rows=1, flush_interval=60)
+    yield log
+    log.close()
+
+
+def wait_for_stats(log, **expected):
+    deadline = time.monotonic() + 5
+    while any(log.stats()[key] != value for key, value in expected.items()):
+        assert time.monotonic() < deadline, log.stats()
+        time.sleep(0.01)
+
+
+def test_round_trip_uses_training_columns(log, tmp_path):
+    log.log(ROW, [75042.19])
+    log.close()
+
+    data = read_prediction_log(str(tmp_path))
+
+    assert list(data.columns[: len(FIELD_COLUMNS)]) == list(FIELD_COLUMNS.values())
+    assert "Price (in USD)" not in data.columns
+    row = data.iloc[0]
+    assert row["Engine Size (L)"] == "Electric"
+    assert row["Predicted Price (in USD)"] == 75042.19
+    assert row["Model Version"] == "test-model"
+
+
+def test_flushed_rows_survive_an_unclean_exit(log, tmp_path):
+    log.log(ROW, [1.0])
+    wait_for_stats(log, written_rows=1)
+    log.log(ROW, [2.0])
+    wait_for_stats(log, written_rows=2)
+
+    # The file is still open: no close(), as after a crash
+    data = read_prediction_log(str(tmp_path))
+
+    assert data["Predicted Price (in USD)"].tolist() == [1.0, 2.0]
+
+
+def test_torn_tail_is_ignored(log, tmp_path):
+    log.log(ROW, [1.0])
+    wait_for_stats(log, written_rows=1)
+    (path,) = glob.glob(os.path.join(str(tmp_path), "*.arrows"))
+    with open(path, "ab") as f:
+        f.write(b"\xff\xff\xff\xff\x10\x00")
+
+    assert len(read_prediction_log(str(tmp_path))) == 1
+
+
+def test_full_buffer_drops_rows(tmp_path):
+    log = PredictionLog(str(tmp_path), "v", max_buffered_rows=2, flush_interval=60)
+    for _ in range(3):
+        log.log(ROW, [1.0])
+    log.close()
+
+    assert log.stats()["dropped_rows"] == 1
+    assert log.stats()["written_rows"] == 2
+
+
+class FlakyStreamWriter:
+    """
+    Wraps a real stream writer; writes raise while ``failing`` is set.
+    """
+
+    failing = False
+
+    def __init__(self, writer):
+        self.writer = writer
+
+    def write_table(self, table):
+        if FlakyStreamWriter.failing:
+            raise OSError("No space left on device")
+        self.writer.write_table(table)
+
+    def close(self):
+        self.writer.close()
+
+
+def test_failed_write_starts_a_new_file(log, tmp_path, monkeypatch):
+    new_stream = pa.ipc.new_stream
+    monkeypatch.setattr(
+        pa.ipc,
+        "new_stream",
+        lambda sink, schema: FlakyStreamWriter(new_stream(sink, schema)),
+    )
+    monkeypatch.setattr(FlakyStreamWriter, "failing", False)
+
+    log.log(ROW, [1.0])
+    wait_for_stats(log, written_rows=1)
+    FlakyStreamWriter.failing = True
+    log.log(ROW, [2.0])
+    wait_for_stats(log, failed_writes=1)
+    FlakyStreamWriter.failing = False
+    log.log(ROW, [3.0])
+    log.close()
+
+    stats = log.stats()
+    assert stats["failed_writes"] == 1
+    assert stats["dropped_rows"] == 1
+    assert stats["files_written"] == 2
+    assert read_prediction_log(str(tmp_path))["Predicted Price (in USD)"].tolist() == [
+        1.0,
+        3.0,
+    ]